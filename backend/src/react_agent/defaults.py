@@ -1,14 +1,14 @@
 # Tool dictionaries by service
-SERVICE_METHODS = {
-    "x": [
+SERVICE_METHODS: dict[str, tuple[str, ...]] = {
+    "x": (
         "X_DeleteTweetById",
         "X_LookupSingleUserByUsername",
         "X_LookupTweetById",
         "X_PostTweet",
         "X_SearchRecentTweetsByKeywords",
         "X_SearchRecentTweetsByUsername",
-    ],
-    "github": [
+    ),
+    "github": (
         "Github_CountStargazers",
         "Github_CreateIssue",
         "Github_CreateIssueComment",
@@ -25,8 +25,8 @@ SERVICE_METHODS = {
         "Github_ListStargazers",
         "Github_SetStarred",
         "Github_UpdatePullRequest",
-    ],
-    "gmail": [
+    ),
+    "gmail": (
         "Google_ListDraftEmails",
         "Google_ListEmails",
         "Google_ReplyToEmail",
@@ -36,8 +36,8 @@ SERVICE_METHODS = {
         "Google_WriteDraftReplyEmail",
         "Google_SearchContactsByEmail",
         "Google_SearchContactsByName",
-    ],
-    "google": [
+    ),
+    "google": (
         "Google_ChangeEmailLabels",
         "Google_CreateContact",
         "Google_CreateLabel",
@@ -51,32 +51,32 @@ SERVICE_METHODS = {
         "Google_SearchThreads",
         "Google_TrashEmail",
         "Google_UpdateDraftEmail",
-    ],
-    "gcal": [
+    ),
+    "gcal": (
         "Google_SearchContactsByEmail",
         "Google_SearchContactsByName",
         "Google_CreateEvent",
         "Google_ListEvents",
         "Google_UpdateEvent",
         "Google_DeleteEvent",
-    ],
-    "linkedin": ["Linkedin_CreateTextPost"],
-    "search": [
-        "Search_SearchGoogle",
-    ],
-    "hotels": ["Search_SearchHotels"],
-    "flights": [
+    ),
+    "linkedin": ("Linkedin_CreateTextPost",),
+    "search": ("Search_SearchGoogle",),
+    "hotels": ("Search_SearchHotels",),
+    "flights": (
         "Search_SearchOneWayFlights",
         "Search_SearchRoundTripFlights",
-    ],
-    "stocks": ["Search_StockSummary", "Search_StockHistoricalData"],
-    "codesandbox": ["CodeSandbox_RunCode"],
+    ),
+    "stocks": ("Search_StockSummary", "Search_StockHistoricalData"),
+    "codesandbox": ("CodeSandbox_RunCode",),
 }
 
-
-def get_tools():
-    """Get all tool names from the SERVICE_METHODS dictionary."""
-    tool_names = []
-    for service, tools in SERVICE_METHODS.items():
-        tool_names.extend([t.split("_")[1] for t in tools])
-    return tool_names
+# Reverse index from full tool name to the services that list it, e.g.
+# "Google_SearchContactsByEmail" -> {"gmail", "google", "gcal"}
+TOOL_TO_SERVICE: dict[str, frozenset[str]] = {
+    tool: frozenset(
+        service for service, methods in SERVICE_METHODS.items() if tool in methods
+    )
+    for tools in SERVICE_METHODS.values()
+    for tool in tools
+}
@@ -1,6 +1,13 @@
-from typing import Annotated, Any, Callable, Union
-
+import hashlib
+import json
+import logging
+import threading
+from functools import lru_cache
+from typing import Annotated, Any, Callable, NotRequired, TypedDict, Union
+
+import cachetools
 from arcadepy import NOT_GIVEN, Arcade, AsyncArcade
+from arcadepy._exceptions import AuthenticationError, PermissionDeniedError
 from arcadepy.types import ExecuteToolResponse, ToolDefinition
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import StructuredTool
@@ -8,6 +15,8 @@ from langchain_core.tools.base import InjectedToolCallId
 from langgraph.types import Command
 from pydantic import BaseModel, Field, create_model
 
+logger = logging.getLogger(__name__)
+
 # Check if LangGraph is enabled
 LANGGRAPH_ENABLED = True
 try:
@@ -25,20 +34,76 @@ TYPE_MAPPING = {
     "json": dict,
 }
 
+# Array types keyed by their Arcade inner value type
+_LIST_TYPES = {val_type: list[_type] for val_type, _type in TYPE_MAPPING.items()}
 
-def get_python_type(val_type: str) -> Any:
-    """Map Arcade value types to Python types.
+_MISSING = object()
 
-    Args:
-        val_type: The value type as a string.
+# (base_url, user_id, tool_name) keys with a completed authorization, to skip re-checking
+_AUTHORIZED: cachetools.TTLCache = cachetools.TTLCache(maxsize=1024, ttl=300)
+_AUTHORIZED_LOCK = threading.Lock()
 
-    Returns:
-        Corresponding Python type.
+# Optional error fields copied into error details, with an optional cast
+_ERROR_FIELDS = (
+    ("additional_prompt_content", None),
+    ("can_retry", str),
+    ("developer_message", str),
+    ("retry_after_ms", str),
+)
+
+
+class ToolErrorDetails(TypedDict):
+    """Details of a failed tool execution."""
+
+    error: str
+    tool: str
+    additional_prompt_content: NotRequired[str]
+    can_retry: NotRequired[str]
+    developer_message: NotRequired[str]
+    retry_after_ms: NotRequired[str]
+
+
+# Types whose single-parameter models are shared between tools
+_PRIMITIVE_TYPES = frozenset((str, float, int, bool))
+
+
+class _EmptyArgs(BaseModel):
+    """Input schema shared by all tools without inferrable parameters."""
+
+
+@lru_cache(maxsize=128)
+def _single_param_model(
+    name: str, param_type: type, required: bool, description: str
+) -> type[BaseModel]:
+    """Build a model with one primitive field, shared by tools of the same shape."""
+    default = ... if required else None
+    return create_model(
+        "ToolArgs",
+        **{name: (param_type, Field(default=default, description=description))},
+    )
+
+
+# Pydantic models built from tool definitions, keyed by _model_cache_key
+_MODEL_CACHE: dict[tuple[str, str, str, str], type[BaseModel]] = {}
+
+
+def _model_cache_key(tool_def: ToolDefinition) -> tuple[str, str, str, str]:
+    """Build the cache key for a tool definition's input model.
+
+    Includes a digest of the input schema so a schema change without a version
+    bump still yields a new model.
     """
-    _type = TYPE_MAPPING.get(val_type)
-    if _type is None:
-        raise ValueError(f"Invalid value type: {val_type}")
-    return _type
+    toolkit = tool_def.toolkit
+    digest = hashlib.blake2b(
+        json.dumps(tool_def.input.model_dump(), sort_keys=True, default=str).encode(),
+        digest_size=8,
+    ).hexdigest()
+    return (
+        toolkit.name if toolkit else "",
+        tool_def.name,
+        getattr(toolkit, "version", None) or "",
+        digest,
+    )
 
 
 def tool_definition_to_pydantic_model(tool_def: ToolDefinition) -> type[BaseModel]:
@@ -50,26 +115,61 @@ def tool_definition_to_pydantic_model(tool_def: ToolDefinition) -> type[BaseMode
     Returns:
         A Pydantic BaseModel class representing the tool's input schema.
     """
+    if not tool_def.input.parameters:
+        return _EmptyArgs
+
+    cache_key = _model_cache_key(tool_def)
+    cached_model = _MODEL_CACHE.get(cache_key)
+    if cached_model is not None:
+        return cached_model
+
     try:
-        fields: dict[str, Any] = {}
+        fields: dict[str, tuple[Any, bool, str]] = {}
         for param in tool_def.input.parameters or []:
             # check if the paramter has the Inferrable annotation set to False
             if param.inferrable is False:
-                print(f"Parameter {param.name} has Inferrable set to False")
+                logger.warning(
+                    "Parameter %s of %s has Inferrable set to False",
+                    param.name,
+                    tool_def.name,
+                )
             else:
-                param_type = get_python_type(param.value_schema.val_type)
-                if param_type == list and param.value_schema.inner_val_type:  # noqa: E721
-                    inner_type: type[Any] = get_python_type(
-                        param.value_schema.inner_val_type
-                    )
-                    param_type = list[inner_type]  # type: ignore[valid-type]
+                val_type = param.value_schema.val_type
+                inner_val_type = param.value_schema.inner_val_type
+                try:
+                    if val_type == "array" and inner_val_type:
+                        param_type = _LIST_TYPES[inner_val_type]
+                    else:
+                        param_type = TYPE_MAPPING[val_type]
+                except KeyError as e:
+                    raise ValueError(f"Invalid value type: {e.args[0]}") from e
                 param_description = param.description or "No description provided."
-                default = ... if param.required else None
                 fields[param.name] = (
                     param_type,
-                    Field(default=default, description=param_description),
+                    bool(param.required),
+                    param_description,
                 )
-        return create_model(f"{tool_def.name}Args", **fields)
+
+        if not fields:
+            model = _EmptyArgs
+        elif len(fields) == 1 and next(iter(fields.values()))[0] in _PRIMITIVE_TYPES:
+            ((name, (param_type, required, description)),) = fields.items()
+            model = _single_param_model(name, param_type, required, description)
+        else:
+            model = create_model(
+                f"{tool_def.name}Args",
+                **{
+                    name: (
+                        param_type,
+                        Field(
+                            default=... if required else None, description=description
+                        ),
+                    )
+                    for name, (param_type, required, description) in fields.items()
+                },
+            )
+        _MODEL_CACHE[cache_key] = model
+        return model
     except ValueError as e:
         raise ValueError(
             f"Error converting {tool_def.name} parameters into pydantic model for langchain: {e}"
@@ -93,7 +193,7 @@ def process_tool_execution_response(
         return execute_response.output.value
 
     # Extract detailed error information
-    error_details = {
+    error_details: ToolErrorDetails = {
         "error": "Unknown error occurred",
         "tool": tool_name,
     }
@@ -103,29 +203,40 @@ def process_tool_execution_response(
         and execute_response.output.error is not None
     ):
         error = execute_response.output.error
-        error_message = (
-            str(error.message) if hasattr(error, "message") else "Unknown error"
+        error_message = getattr(error, "message", _MISSING)
+        error_details["error"] = (
+            str(error_message) if error_message is not _MISSING else "Unknown error"
         )
-        error_details["error"] = error_message
 
         # Add all non-None optional error fields to the details
-        if (
-            hasattr(error, "additional_prompt_content")
-            and error.additional_prompt_content is not None
-        ):
-            error_details["additional_prompt_content"] = error.additional_prompt_content
-        if hasattr(error, "can_retry") and error.can_retry is not None:
-            error_details["can_retry"] = str(error.can_retry)
-        if hasattr(error, "developer_message") and error.developer_message is not None:
-            error_details["developer_message"] = str(error.developer_message)
-        if hasattr(error, "retry_after_ms") and error.retry_after_ms is not None:
-            error_details["retry_after_ms"] = str(error.retry_after_ms)
+        optional_fields = (
+            (name, cast, getattr(error, name, None)) for name, cast in _ERROR_FIELDS
+        )
+        error_details.update(
+            {  # type: ignore[typeddict-item]
+                name: cast(value) if cast else value
+                for name, cast, value in optional_fields
+                if value is not None
+            }
+        )
 
     if langgraph:
         raise NodeInterrupt(error_details)
     return error_details
 
 
+def _authorization_required(auth_url: str | None, langgraph: bool) -> dict[str, str]:
+    """Report that the user must authorize before the tool can run.
+
+    Raises:
+        NodeInterrupt: If LangGraph-specific behavior is enabled.
+    """
+    auth_message = f"Please use the following link to authorize: {auth_url}"
+    if langgraph:
+        raise NodeInterrupt(auth_message)
+    return {"error": auth_message}
+
+
 def create_tool_function(
     client: Arcade,
     tool_name: str,
@@ -156,9 +267,11 @@ def create_tool_function(
         tool_def.requirements is not None
         and tool_def.requirements.authorization is not None
     )
-    non_inferrable_params = [
-        param for param in tool_def.input.parameters if param.inferrable is False
-    ]
+    non_inferrable_names = tuple(
+        param.name
+        for param in tool_def.input.parameters or []
+        if param.inferrable is False
+    )
 
     def tool_function(config: RunnableConfig, **kwargs: Any) -> Any:
         """Execute the Arcade tool with the given parameters.
@@ -176,12 +289,14 @@ def create_tool_function(
         user_id = config.get("configurable", {}).get("user_id") if config else None
 
         # check for non-infferable params in config
-        non_infer_params = {}
-        for param in non_inferrable_params:
-            non_infer_params[param.name] = kwargs.get(param.name)
-            if non_infer_params[param.name] is None:
-                raise ValueError(f"Missing required parameter: {param.name}")
+        non_infer_params = {name: kwargs.get(name) for name in non_inferrable_names}
+        missing = next(
+            (name for name, value in non_infer_params.items() if value is None), None
+        )
+        if missing is not None:
+            raise ValueError(f"Missing required parameter: {missing}")
 
+        auth_key = (str(client.base_url), user_id, tool_name)
         if requires_authorization:
             if user_id is None:
                 error_message = f"user_id is required to run {tool_name}"
@@ -189,23 +304,45 @@ def create_tool_function(
                     raise NodeInterrupt(error_message)
                 return {"error": error_message}
 
-            # Authorize the user for the tool
-            auth_response = client.tools.authorize(tool_name=tool_name, user_id=user_id)
-            if auth_response.status != "completed":
-                auth_message = (
-                    f"Please use the following link to authorize: {auth_response.url}"
+            # Authorize the user for the tool, unless it recently completed
+            with _AUTHORIZED_LOCK:
+                authorized = auth_key in _AUTHORIZED
+            if not authorized:
+                auth_response = client.tools.authorize(
+                    tool_name=tool_name, user_id=user_id
                 )
-                if langgraph:
-                    raise NodeInterrupt(auth_message)
-                return {"error": auth_message}
+                if auth_response.status != "completed":
+                    return _authorization_required(auth_response.url, langgraph)
+                with _AUTHORIZED_LOCK:
+                    _AUTHORIZED[auth_key] = True
 
         # Execute the tool with provided inputs
-        print(f"Executing tool with inputs: {kwargs}, {non_infer_params}")
-        execute_response = client.tools.execute(
-            tool_name=tool_name,
-            input={**kwargs, **non_infer_params},
-            user_id=user_id if user_id is not None else NOT_GIVEN,
+        logger.debug(
+            "Executing tool %s inputs=%s non_infer=%s",
+            tool_name,
+            kwargs,
+            non_infer_params,
         )
+        try:
+            execute_response = client.tools.execute(
+                tool_name=tool_name,
+                input={**kwargs, **non_infer_params},
+                user_id=user_id if user_id is not None else NOT_GIVEN,
+            )
+        except (PermissionDeniedError, AuthenticationError):
+            # The cached authorization is stale, check again on the next call
+            with _AUTHORIZED_LOCK:
+                _AUTHORIZED.pop(auth_key, None)
+            raise
+
+        # A revoked or expired authorization comes back as a failed response
+        output = execute_response.output
+        authorization = output.authorization if output is not None else None
+        if not execute_response.success or authorization is not None:
+            with _AUTHORIZED_LOCK:
+                _AUTHORIZED.pop(auth_key, None)
+        if not execute_response.success and authorization is not None:
+            return _authorization_required(authorization.url, langgraph)
 
         result = process_tool_execution_response(execute_response, tool_name, langgraph)
 
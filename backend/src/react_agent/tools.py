@@ -2,29 +2,57 @@ import asyncio
 import json
 import logging
 import os
+import threading
+import weakref
 from functools import lru_cache
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from arcadepy import Arcade
+import cachetools
+import orjson
+from arcadepy import Arcade, AsyncArcade
 from arcadepy._exceptions import APIError, AuthenticationError, PermissionDeniedError
-from arcadepy.types import ToolDefinition
+from arcadepy.types import ExecuteToolResponse, ToolDefinition
 from arcadepy.types.execute_tool_response import Output
 from langchain_core.tools import StructuredTool
 from langgraph.config import get_config
 from langgraph.types import interrupt
 
-from react_agent.defaults import get_tools
+from react_agent.defaults import TOOL_TO_SERVICE
 from react_agent.tool_utils import tool_definition_to_pydantic_model
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-# Import the service methods from defaults
+# Cache of the filtered tool definitions so agent warm-starts skip the catalog fetch
+_TOOLS_CACHE: cachetools.TTLCache = cachetools.TTLCache(maxsize=1, ttl=300)
+_TOOLS_LOCK = threading.Lock()
 
+# StructuredTools keyed by tool ID, description and args schema, reused across
+# graph builds. Cleared whenever the tool catalog is refetched.
+_LANGCHAIN_TOOLS: Dict[Tuple[str, Optional[str], type], StructuredTool] = {}
 
+# Async clients keyed by the event loop they were created on
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncArcade] = (
+    weakref.WeakKeyDictionary()
+)
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def _client_settings() -> Dict[str, Any]:
+    """Get the Arcade client settings from the environment."""
+    # Note: The Arcade client looks for authentication credentials
+    api_key = os.environ.get("ARCADE_API_KEY") or os.environ.get("ARCADE_BEARER_TOKEN")
+    base_url = os.environ.get("ARCADE_BASE_URL", "https://api.arcade.dev")
+    return {"api_key": api_key, "base_url": base_url}
+
+
+@lru_cache(maxsize=1)
 def get_arcade_client() -> Arcade:
     """Get an initialized Arcade client instance.
 
+    The client is created and health-checked once per process; call
+    `get_arcade_client.cache_clear()` to force a new client.
+
     Returns:
         An initialized Arcade client
 
@@ -32,16 +60,7 @@ def get_arcade_client() -> Arcade:
         Exception: If required credentials are missing
     """
     try:
-        # Note: The Arcade client looks for authentication credentials
-        api_key = os.environ.get("ARCADE_API_KEY") or os.environ.get(
-            "ARCADE_BEARER_TOKEN"
-        )
-        base_url = os.environ.get("ARCADE_BASE_URL", "https://api.arcade.dev")
-
-        client = Arcade(
-            api_key=api_key,
-            base_url=base_url,
-        )
+        client = Arcade(**_client_settings())
 
         # Perform a health check to verify connectivity
         client.health.check()
@@ -51,26 +70,65 @@ def get_arcade_client() -> Arcade:
         raise
 
 
-def _get_available_tools() -> Tuple[List[str], Dict[str, ToolDefinition]]:
+def get_async_arcade_client() -> AsyncArcade:
+    """Get the async Arcade client for the running event loop.
+
+    Each event loop gets its own client, since pooled httpx connections cannot be
+    shared across loops. Clients are dropped along with their loop. Connectivity
+    is verified by the sync client's health check, so none is performed here.
+
+    Returns:
+        An initialized AsyncArcade client
+    """
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        client = _ASYNC_CLIENTS.get(loop)
+        if client is None:
+            client = _ASYNC_CLIENTS[loop] = AsyncArcade(**_client_settings())
+    return client
+
+
+def _discard_async_arcade_client(client: AsyncArcade) -> None:
+    """Stop handing out `client` so the next call builds a new async client.
+
+    The cache is only cleared if it still holds `client`, so a replacement
+    built by a concurrent call is kept.
+    """
+    loop = asyncio.get_running_loop()
+    with _ASYNC_CLIENTS_LOCK:
+        if _ASYNC_CLIENTS.get(loop) is client:
+            del _ASYNC_CLIENTS[loop]
+
+
+def _get_available_tools() -> List[ToolDefinition]:
     """Get available tools from the Arcade client with caching.
 
     Returns:
-        A tuple of (tool_ids, available_tools_by_name)
+        The definitions of the tools listed in SERVICE_METHODS
     """
-    client = get_arcade_client()
-    try:
-        response = client.tools.list(limit=1000)
-        available_tools = response.items
-        tool_definitions = {tool.name: tool for tool in available_tools}
-        tool_names = get_tools()
-        final_tools = []
-        for t, definition in tool_definitions.items():
-            if t in tool_names:
-                final_tools.append(definition)
-        return final_tools
-    except Exception as e:
-        logger.error(f"Failed to get available tools: {str(e)}")
-        raise
+    with _TOOLS_LOCK:
+        if "tools" in _TOOLS_CACHE:
+            return _TOOLS_CACHE["tools"]
+
+        client = get_arcade_client()
+        try:
+            # Iterating the page auto-paginates; stop once every desired tool is found.
+            # Match on the full tool ID, since bare names repeat across toolkits.
+            remaining = set(TOOL_TO_SERVICE)
+            final_tools = []
+            for tool in client.tools.list(limit=100):
+                tool_id = f"{tool.toolkit.name}_{tool.name}"
+                if tool_id in remaining:
+                    final_tools.append(tool)
+                    remaining.discard(tool_id)
+                    if not remaining:
+                        break
+            _TOOLS_CACHE["tools"] = final_tools
+            _LANGCHAIN_TOOLS.clear()
+            return final_tools
+        except Exception as e:
+            logger.error(f"Failed to get available tools: {str(e)}")
+            raise
 
 
 def _handle_authorization_error(output: Output, user_id: str) -> None:
@@ -105,25 +163,12 @@ def _handle_authorization_error(output: Output, user_id: str) -> None:
     )
 
 
-def _handle_auth_exception(exception: Exception, user_id: str, tool_name: str) -> None:
-    """Handle authentication-related exceptions.
+def _auth_interrupt(auth_url: str) -> Any:
+    """Interrupt the graph and ask the user to complete authorization.
 
     Args:
-        exception: The exception that was raised
-        user_id: The ID of the user making the request
+        auth_url: The URL the user should visit to authorize
     """
-    logger.info(f"Authentication error for user {user_id}, initiating auth flow")
-    # Extract URL from exception if available or use a default auth URL
-    auth_url = getattr(exception, "url", None)
-    if not auth_url:
-        client = get_arcade_client()
-        auth_response = client.tools.authorize(tool_name=tool_name, user_id=user_id)
-        logger.info(f"Authorization response: {auth_response}")
-        if auth_response.url:
-            auth_url = auth_response.url
-        else:
-            raise ValueError("No authorization URL found in response")
-
     return interrupt(
         [
             {
@@ -143,6 +188,88 @@ def _handle_auth_exception(exception: Exception, user_id: str, tool_name: str) -
     )
 
 
+def _handle_auth_exception(
+    exception: Exception, user_id: str, tool_name: str, client: Arcade
+) -> None:
+    """Handle authentication-related exceptions.
+
+    Args:
+        exception: The exception that was raised
+        user_id: The ID of the user making the request
+        tool_name: The name of the tool that required authorization
+        client: The Arcade client used for the failed call
+    """
+    logger.info(f"Authentication error for user {user_id}, initiating auth flow")
+    # Extract URL from exception if available or use a default auth URL
+    auth_url = getattr(exception, "url", None)
+    if not auth_url:
+        auth_response = client.tools.authorize(tool_name=tool_name, user_id=user_id)
+        logger.info(f"Authorization response: {auth_response}")
+        if auth_response.url:
+            auth_url = auth_response.url
+        else:
+            raise ValueError("No authorization URL found in response")
+
+    return _auth_interrupt(auth_url)
+
+
+async def _ahandle_auth_exception(
+    exception: Exception, user_id: str, tool_name: str, client: AsyncArcade
+) -> None:
+    """Handle authentication-related exceptions for async tool calls.
+
+    Args:
+        exception: The exception that was raised
+        user_id: The ID of the user making the request
+        tool_name: The name of the tool that required authorization
+        client: The async Arcade client used for the failed call
+    """
+    logger.info(f"Authentication error for user {user_id}, initiating auth flow")
+    auth_url = getattr(exception, "url", None)
+    if not auth_url:
+        auth_response = await client.tools.authorize(
+            tool_name=tool_name, user_id=user_id
+        )
+        logger.info(f"Authorization response: {auth_response}")
+        if auth_response.url:
+            auth_url = auth_response.url
+        else:
+            raise ValueError("No authorization URL found in response")
+
+    return _auth_interrupt(auth_url)
+
+
+def _get_user_id() -> str:
+    """Get the authenticated LangGraph user ID from the current run config.
+
+    Raises:
+        ValueError: If the user ID is missing from the configuration
+    """
+    config = get_config()
+    user_id = config["configurable"].get("langgraph_auth_user_id")
+
+    if not user_id:
+        logger.error("Missing langgraph_auth_user_id in configuration")
+        raise ValueError("Missing langgraph_auth_user_id in configuration")
+    return user_id
+
+
+def _get_output_value(response: ExecuteToolResponse, tool_id: str) -> Any:
+    """Return the output value of a tool execution, raising if it failed.
+
+    Dicts and lists are serialized to JSON; other values are returned unchanged.
+    """
+    if not response.success:
+        error_msg = response.output.error or "Unknown error occurred"
+        logger.error(f"Tool call failed: {error_msg}")
+        raise ValueError(f"Tool call to {tool_id} failed: {error_msg}")
+
+    value = response.output.value
+    if isinstance(value, (dict, list)):
+        return convert_output_to_json(value)
+    return value
+
+
 def create_tool_caller(tool_id: str) -> Callable[..., Any]:
     """Create a tool caller for the specified tool.
 
@@ -158,12 +285,7 @@ def create_tool_caller(tool_id: str) -> Callable[..., Any]:
     def call_tool(**kwargs: Any) -> Any:
         """Call a tool with the given parameters."""
         client = get_arcade_client()
-        config = get_config()
-        user_id = config["configurable"].get("langgraph_auth_user_id")
-
-        if not user_id:
-            logger.error("Missing langgraph_auth_user_id in configuration")
-            raise ValueError("Missing langgraph_auth_user_id in configuration")
+        user_id = _get_user_id()
 
         logger.debug(f"Calling tool {tool_id} for user {user_id} with args: {kwargs}")
 
@@ -172,18 +294,14 @@ def create_tool_caller(tool_id: str) -> Callable[..., Any]:
             response = client.tools.execute(
                 tool_name=tool_id, input=kwargs, user_id=user_id
             )
-
-            # Check for successful response
-            if not response.success:
-                error_msg = response.output.error or "Unknown error occurred"
-                logger.error(f"Tool call failed: {error_msg}")
-                raise ValueError(f"Tool call to {tool_id} failed: {error_msg}")
-
-            return response.output.value
+            return _get_output_value(response, tool_id)
 
         except (PermissionDeniedError, AuthenticationError) as e:
+            if isinstance(e, AuthenticationError):
+                # Credentials may have changed, rebuild the client on the next call
+                get_arcade_client.cache_clear()
             # Handle auth errors without depending on response variable
-            return _handle_auth_exception(e, user_id, tool_id)
+            return _handle_auth_exception(e, user_id, tool_id, client)
         except Exception as e:
             # Handle unexpected errors
             logger.exception(f"Unexpected error calling tool {tool_id}: {str(e)}")
@@ -192,10 +310,57 @@ def create_tool_caller(tool_id: str) -> Callable[..., Any]:
     return call_tool
 
 
+def create_async_tool_caller(tool_id: str) -> Callable[..., Awaitable[Any]]:
+    """Create an async tool caller for the specified tool.
+
+    Concurrent calls share the async client's connection pool, so LangGraph can
+    overlap tool calls on a single event loop.
+
+    Args:
+        tool_id: The ID of the tool to call
+
+    Returns:
+        A coroutine function that will execute the tool with the given parameters
+    """
+
+    async def call_tool(**kwargs: Any) -> Any:
+        """Call a tool with the given parameters."""
+        client = get_async_arcade_client()
+        user_id = _get_user_id()
+
+        logger.debug(f"Calling tool {tool_id} for user {user_id} with args: {kwargs}")
+
+        try:
+            response = await client.tools.execute(
+                tool_name=tool_id, input=kwargs, user_id=user_id
+            )
+            return _get_output_value(response, tool_id)
+
+        except (PermissionDeniedError, AuthenticationError) as e:
+            if isinstance(e, AuthenticationError):
+                # Credentials may have changed, rebuild the clients on the next call.
+                # Concurrent calls may still be using this client, so it is not
+                # closed here; it is released once nothing references it.
+                get_arcade_client.cache_clear()
+                _discard_async_arcade_client(client)
+            return await _ahandle_auth_exception(e, user_id, tool_id, client)
+        except Exception as e:
+            logger.exception(f"Unexpected error calling tool {tool_id}: {str(e)}")
+            raise
+
+    return call_tool
+
+
 def convert_output_to_json(output: Any) -> str:
     """Convert output to JSON string."""
     if isinstance(output, dict) or isinstance(output, list):
-        return json.dumps(output)
+        try:
+            return orjson.dumps(
+                output, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            # orjson rejects some values the stdlib accepts, e.g. integers over 64 bits
+            return json.dumps(output, default=str, ensure_ascii=False)
     else:
         return str(output)
 
@@ -204,23 +369,35 @@ def get_langchain_tools(tool_types: Optional[List[str]] = None) -> List[Structur
     """Get structured tools, optionally filtered by tool type.
 
     Args:
-        tool_types: List of tool types to include (e.g., "x", "github")
+        tool_types: List of tool types to include (e.g., "x", "github").
+            All available tools are included when empty.
 
     Returns:
         List of structured tools
     """
     tools = _get_available_tools()
+
     langchain_tools = []
     for tool in tools:
+        tool_id = "_".join((tool.toolkit.name, tool.name))
+        # Only build schemas for tools in the selected services; every bound tool's
+        # schema is materialized when the model binds tools, so skip the rest here.
+        if tool_types and TOOL_TO_SERVICE[tool_id].isdisjoint(tool_types):
+            continue
         try:
-            langchain_tools.append(
-                StructuredTool(
+            args_schema = tool_definition_to_pydantic_model(tool)
+            cache_key = (tool_id, tool.description, args_schema)
+            langchain_tool = _LANGCHAIN_TOOLS.get(cache_key)
+            if langchain_tool is None:
+                langchain_tool = StructuredTool(
                     name=tool.name,
                     description=tool.description,
-                    args_schema=tool_definition_to_pydantic_model(tool),
-                    func=create_tool_caller("_".join((tool.toolkit.name, tool.name))),
+                    args_schema=args_schema,
+                    func=create_tool_caller(tool_id),
+                    coroutine=create_async_tool_caller(tool_id),
                 )
-            )
+                _LANGCHAIN_TOOLS[cache_key] = langchain_tool
+            langchain_tools.append(langchain_tool)
         except Exception as e:
             logger.error(f"Failed to create tool for {tool.name}: {str(e)}")
 